@@ -1,5 +1,6 @@
 import asyncio
 import inspect
+import json
 import logging
 import os
 from pathlib import Path
@@ -7,7 +8,7 @@ import pkgutil
 import re
 import subprocess
 import sys
-from typing import Callable
+from typing import Callable, Optional
 
 import usb.core
 
@@ -18,6 +19,10 @@ PA_GAME_NODE_NAME = 'Arctis_Game'
 PA_CHAT_NODE_NAME = 'Arctis_Chat'
 
 
+def is_arctis_sink(sink: str) -> bool:
+    return 'arctis' in sink.lower()
+
+
 class ArctisManagerDaemon:
     log: logging.Logger
 
@@ -53,7 +58,7 @@ class ArctisManagerDaemon:
         self.log.setLevel(log_level)
 
     def load_device_managers(self):
-        registered_devices = []
+        registered_devices = set()
 
         # Dynamically instantiate the device managers
         for _, name, _ in pkgutil.iter_modules(arctis_manager.devices.__path__):
@@ -63,7 +68,7 @@ class ArctisManagerDaemon:
                     device_manager = cls()
                     if device_manager.get_device_name() not in registered_devices:
                         self.register_device(cls())
-                        registered_devices.append(device_manager.get_device_name())
+                        registered_devices.add(device_manager.get_device_name())
 
     def register_device(self, device: DeviceManager):
         if next((
@@ -90,17 +95,20 @@ class ArctisManagerDaemon:
 
         self.log.debug('Getting Arctis sink.')
         try:
-            pactl_short_sinks = os.popen("pactl list short sinks").readlines()
-            # grab any elements from list of pactl sinks that are Arctis
-            arctis = re.compile('.*[aA]rctis.*')
-            arctis_sink = list(filter(arctis.match, pactl_short_sinks))[0]
-
-            # split the arctis line on tabs (which form table given by 'pactl short sinks')
-            tabs_pattern = re.compile(r'\t')
-            tabs_re = re.split(tabs_pattern, arctis_sink)
-
-            # skip first element of tabs_re (sink's ID which is not persistent)
-            arctis_device = tabs_re[1]
+            sinks = self.get_pa_sinks()
+            if sinks is not None:
+                arctis_device = next(sink['name'] for sink in sinks if is_arctis_sink(sink['name']))
+            else:
+                pactl_short_sinks = os.popen("pactl list short sinks").readlines()
+                # grab any elements from list of pactl sinks that are Arctis
+                arctis_sink = next(sink for sink in pactl_short_sinks if is_arctis_sink(sink))
+
+                # split the arctis line on tabs (which form table given by 'pactl short sinks')
+                tabs_pattern = re.compile(r'\t')
+                tabs_re = re.split(tabs_pattern, arctis_sink)
+
+                # skip first element of tabs_re (sink's ID which is not persistent)
+                arctis_device = tabs_re[1]
             self.log.debug(f"Arctis sink identified as {arctis_device}")
             default_sink = arctis_device
         except Exception as e:
@@ -151,9 +159,24 @@ class ArctisManagerDaemon:
         self.previous_sink = subprocess.check_output(['pactl', 'get-default-sink']).decode('utf-8').strip()
         self.set_pa_audio_sink(PA_GAME_NODE_NAME)
 
+    def get_pa_sinks(self) -> Optional[list[dict]]:
+        '''
+        Get the PulseAudio sinks as reported by `pactl --format=json list sinks`.
+        Returns None if pactl does not support the JSON output format (pactl < 16).
+        '''
+
+        try:
+            return json.loads(subprocess.run(['pactl', '--format=json', 'list', 'sinks'], capture_output=True, check=True).stdout)
+        except (subprocess.CalledProcessError, json.JSONDecodeError):
+            return None
+
     def get_pa_default_sink_description(self) -> str:
         default_sink_name = subprocess.check_output(['pactl', 'get-default-sink']).decode('utf-8').strip()
 
+        sinks = self.get_pa_sinks()
+        if sinks is not None:
+            return next((sink.get('description', 'Unknown') for sink in sinks if sink['name'] == default_sink_name), 'Unknown')
+
         env = os.environ
         env = dict(env, **{'LANG': 'en_US'})
         pactl_list_sinks = iter(subprocess.check_output(['pactl', 'list', 'sinks'], env=env).decode('utf-8').strip().split('\n'))
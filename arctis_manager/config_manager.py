@@ -1,15 +1,25 @@
+from functools import lru_cache
 import json
 import os
 from pathlib import Path
 from typing import Optional
 
 
+@lru_cache(maxsize=32)
+def device_config_file_name(vendor_id: int, product_id: int) -> str:
+    return f'device_{vendor_id:x}_{product_id:x}.json'
+
+
 class ConfigManager:
     config_path: Path
 
+    _config_cache: dict[tuple[int, int], dict]
+
+    _instance: Optional['ConfigManager'] = None
+
     @staticmethod
-    def get_instance():
-        if not hasattr(ConfigManager, '_instance'):
+    def get_instance() -> 'ConfigManager':
+        if ConfigManager._instance is None:
             ConfigManager._instance = ConfigManager()
 
         return ConfigManager._instance
@@ -20,14 +30,26 @@ class ConfigManager:
         self.config_path = Path(config_home).joinpath('arctis_manager')
         self.config_path.mkdir(parents=True, exist_ok=True)
 
+        self._config_cache = {}
+
     def get_config(self, vendor_id: int, product_id: int) -> Optional[dict]:
-        config_file_path = self.config_path.joinpath(f'device_{hex(vendor_id)[2:]}_{hex(product_id)[2:]}.json')
+        # Callers mutate the returned dict before saving it: hand out a copy of the cached one
+        if (vendor_id, product_id) in self._config_cache:
+            return dict(self._config_cache[(vendor_id, product_id)])
+
+        config_file_path = self.config_path.joinpath(device_config_file_name(vendor_id, product_id))
         if config_file_path.is_file():
-            return json.load(config_file_path.open('r'))
+            self._config_cache[(vendor_id, product_id)] = json.loads(config_file_path.read_bytes())
+
+            return dict(self._config_cache[(vendor_id, product_id)])
 
         return None
 
     def save_config(self, vendor_id: int, product_id: int, config: dict):
-        config_file_path = self.config_path.joinpath(f'device_{hex(vendor_id)[2:]}_{hex(product_id)[2:]}.json')
-        with config_file_path.open('w') as f:
-            json.dump(config, f)
+        config_file_path = self.config_path.joinpath(device_config_file_name(vendor_id, product_id))
+        # Write to a temporary file first, so that a crash mid-write does not leave a truncated config behind
+        tmp_file_path = config_file_path.with_suffix('.json.tmp')
+        tmp_file_path.write_bytes(json.dumps(config).encode('utf-8'))
+        os.replace(tmp_file_path, config_file_path)
+
+        self._config_cache[(vendor_id, product_id)] = dict(config)
@@ -1,4 +1,7 @@
-from typing import Optional
+import logging
+import struct
+from sys import intern
+from typing import NamedTuple, Optional
 
 from arctis_manager.config_manager import ConfigManager
 from arctis_manager.device_manager import (DeviceState, DeviceManager,
@@ -19,12 +22,128 @@ INACTIVE_TIME_MINUTES = {
 }
 
 STATUS_REQUEST_MESSAGE = [0x06, 0xb0]
+# Interface / endpoint the GameDAC sends its volume, mix and status packets on
+GAMEDAC_ENDPOINT = InterfaceEndpoint(7, 0)
+# The 14 status bytes following the 0x06 0xb0 header
+STATUS_STRUCT = struct.Struct('14B')
+
+# Translation keys (relative to device_status_values) of the status values.
+# Interned, so that equal keys built anywhere else resolve to the very same string objects.
+ON_OFF_OFF = intern('on_off.off')
+ON_OFF_ON = intern('on_off.on')
+DB_MINUS_12DB = intern('db.-12db')
+CONNECTION_CONNECTED = intern('connection.connected')
+CONNECTION_DISCONNECTED = intern('connection.disconnected')
+CONNECTION_OFFLINE = intern('connection.offline')
+CONNECTION_ONLINE = intern('connection.online')
+CONNECTION_CABLE_CHARGING = intern('connection.cable_charging')
+MIC_STATUS_MUTED = intern('mic_status.muted')
+MIC_STATUS_UNMUTED = intern('mic_status.unmuted')
+ANC_TRANSPARENT = intern('anc.transparent')
+WIRELESS_MODE_SPEED = intern('wireless_mode.speed')
+WIRELESS_MODE_RANGE = intern('wireless_mode.range')
+PAIRING_NOT_PAIRED = intern('pairing.not_paired')
+PAIRING_PAIRED_OFFLINE = intern('pairing.paired_offline')
+
+# Status value -> translation key.
+# Values not listed fall back to the default given at lookup time.
+ON_OFF = {0x00: ON_OFF_OFF}
+BLUETOOTH_AUTO_MUTE = {0x00: ON_OFF_OFF, 0x01: DB_MINUS_12DB}
+BLUETOOTH_POWER_STATUS = {0x01: ON_OFF_OFF}
+BLUETOOTH_CONNECTION = {0x00: ON_OFF_OFF, 0x01: CONNECTION_CONNECTED}
+MIC_STATUS = {0x00: MIC_STATUS_UNMUTED}
+NOISE_CANCELLING = {0x00: ON_OFF_OFF, 0x01: ANC_TRANSPARENT}
+WIRELESS_MODE = {0x00: WIRELESS_MODE_SPEED}
+WIRELESS_PAIRING = {0x01: PAIRING_NOT_PAIRED, 0x04: PAIRING_PAIRED_OFFLINE}
+HEADSET_POWER_STATUS = {0x01: CONNECTION_OFFLINE, 0x02: CONNECTION_CABLE_CHARGING}
+
+
+def battery_charge(value: int) -> float:
+    return round(value / 8, 2)
+
+
+def noise_cancelling_level(value: int) -> float:
+    return round(value / 10, 0)
+
+
+def mic_led_brightness(value: int) -> float:
+    return value / 10
+
+
+COMMAND_PACKET_SIZE = 64
+
+
+class SettingCommand(NamedTuple):
+    '''Command whose last byte is the value of a local setting (see get_local_settings)'''
+
+    prefix: list[int]
+    setting: str
+
+
+# Initialization sequence sent by init_device.
+INIT_COMMANDS: tuple[tuple[list[int] | SettingCommand, bool], ...] = (
+    # Command, expects response
+
+    # Series of queries / responses
+    ([0x06, 0x20], True),
+    ([0x06, 0x20], True),
+    ([0x06, 0x10], True),
+    ([0x06, 0x10], True),
+    ([0x06, 0x10], True),
+    ([0x06, 0x3b], False),  # Correction?
+    ([0x06, 0x8d, 0x01], True),
+    ([0x06, 0x20], True),
+    ([0x06, 0x20], True),
+    ([0x06, 0x20], True),
+    ([0x06, 0x80], True),
+    ([0x06, 0x3b], False),  # Correction?
+    # Burst of commands (device init?)
+    ([0x06, 0x8d, 0x01], False),
+    ([0x06, 0x33, 0x14, 0x14, 0x14], False),  # Equalizer with 3 bands
+    (SettingCommand([0x06, 0xc3], 'wireless_mode'), False),  # 2.4G mode (0x00: speed, 0x01: range)
+    ([0x06, 0x2e, 0x00], False),  # Set equalizer preset (0)
+    (SettingCommand([0x06, 0xc1], 'pm_shutdown'), False),  # Set inactive time (to 30 minutes, see INACTIVE_TIME_MINUTES)
+    ([0x06, 0x85, 0x0a], False),
+    (SettingCommand([0x06, 0x37], 'mic_volume'), False),  # Mic volume 100% (01 (mute) - a0 (100%))
+    ([0x06, 0xb2], False),
+    ([0x06, 0x47, 0x64, 0x00, 0x64], False),
+    ([0x06, 0x83, 0x01], False),
+    ([0x06, 0x89, 0x00], False),
+    (SettingCommand([0x06, 0x27], 'mic_gain'), False),  # Gain (0x01: low, 0x02: high)
+    ([0x06, 0xb3, 0x00], False),
+    (SettingCommand([0x06, 0x39], 'mic_side_tone'), False),  # Set the sidetone to 0 (off) -> possible values: 0 (off), 1 (low), 2 (medium), 3 (high)
+    (SettingCommand([0x06, 0xbf], 'mic_led_brightness'), False),  # Mute mic led brightness (out of 10)
+    ([0x06, 0x43, 0x01], False),
+    ([0x06, 0x69, 0x00], False),
+    ([0x06, 0x3b, 0x00], False),
+    ([0x06, 0x8d, 0x01], False),
+    ([0x06, 0x49, 0x01], False),
+    ([0x06, 0xb7, 0x00], False),
+
+    # Another series of queries (perhaps for confirmation?)
+    ([0x06, 0xb7, 0x00], True),
+    ([0x06, 0xb7, 0x00], True),
+    (STATUS_REQUEST_MESSAGE, True),  # Get device status
+    ([0x06, 0x20, 0x00], True),
+    ([0x06, 0xb7, 0x00], True),
+)
+
+# The commands above, zero-filled once at import time. Setting commands depend on the local settings and are built by init_device.
+INIT_PACKETS: tuple[bytes | SettingCommand, ...] = tuple(
+    command if isinstance(command, SettingCommand) else bytes(command).ljust(COMMAND_PACKET_SIZE, b'\x00')
+    for command, _ in INIT_COMMANDS
+)
 
 
 class ArctisNovaProWirelessDevice(DeviceManager):
     game_mix: int = None
     chat_mix: int = None
 
+    # Resolved once from the device's descriptors (see the getters below)
+    _listen_endpoints: list[InterfaceEndpoint] = None
+    _request_endpoint: InterfaceEndpoint = None
+    _commands_endpoint_address: int = None
+
     def get_local_settings(self) -> dict[str, int]:
         '''
         Returns the set of settings that are being set during initialization.
@@ -52,10 +171,27 @@ class ArctisNovaProWirelessDevice(DeviceManager):
         return 0x12e0
 
     def get_endpoint_addresses_to_listen(self) -> list[InterfaceEndpoint]:
-        return [self.utility_guess_endpoint(7, 'in')]
+        if self._listen_endpoints is None:
+            endpoint = self.utility_guess_endpoint(7, 'in')
+            if endpoint is None:
+                return [endpoint]
+
+            self._listen_endpoints = [endpoint]
+
+        return self._listen_endpoints
 
     def get_request_device_status(self):
-        return self.utility_guess_endpoint(7, 'out'), STATUS_REQUEST_MESSAGE
+        if self._request_endpoint is None:
+            self._request_endpoint = self.utility_guess_endpoint(7, 'out')
+
+        return self._request_endpoint, STATUS_REQUEST_MESSAGE
+
+    def get_commands_endpoint_address(self) -> int:
+        if self._commands_endpoint_address is None:
+            endpoint, _ = self.get_request_device_status()
+            self._commands_endpoint_address = self.device[0].interfaces()[endpoint.interface].endpoints()[endpoint.endpoint].bEndpointAddress
+
+        return self._commands_endpoint_address
 
     def init_device(self):
         '''
@@ -66,98 +202,28 @@ class ArctisNovaProWirelessDevice(DeviceManager):
 
         local_settings = self.get_local_settings()
 
-        commands = [
-            # Command, expects response
-
-            # Series of queries / responses
-            ([0x06, 0x20], True),
-            ([0x06, 0x20], True),
-            ([0x06, 0x10], True),
-            ([0x06, 0x10], True),
-            ([0x06, 0x10], True),
-            ([0x06, 0x3b], False),  # Correction?
-            ([0x06, 0x8d, 0x01], True),
-            ([0x06, 0x20], True),
-            ([0x06, 0x20], True),
-            ([0x06, 0x20], True),
-            ([0x06, 0x80], True),
-            ([0x06, 0x3b], False),  # Correction?
-            # Burst of commands (device init?)
-            ([0x06, 0x8d, 0x01], False),
-            ([0x06, 0x33, 0x14, 0x14, 0x14], False),  # Equalizer with 3 bands
-            ([0x06, 0xc3, local_settings['wireless_mode']], False),  # 2.4G mode (0x00: speed, 0x01: range)
-            ([0x06, 0x2e, 0x00], False),  # Set equalizer preset (0)
-            ([0x06, 0xc1, local_settings['pm_shutdown']], False),  # Set inactive time (to 30 minutes, see INACTIVE_TIME_MINUTES)
-            ([0x06, 0x85, 0x0a], False),
-            ([0x06, 0x37, local_settings['mic_volume']], False),  # Mic volume 100% (01 (mute) - a0 (100%))
-            ([0x06, 0xb2], False),
-            ([0x06, 0x47, 0x64, 0x00, 0x64], False),
-            ([0x06, 0x83, 0x01], False),
-            ([0x06, 0x89, 0x00], False),
-            ([0x06, 0x27, local_settings['mic_gain']], False),  # Gain (0x01: low, 0x02: high)
-            ([0x06, 0xb3, 0x00], False),
-            ([0x06, 0x39, local_settings['mic_side_tone']], False),  # Set the sidetone to 0 (off) -> possible values: 0 (off), 1 (low), 2 (medium), 3 (high)
-            ([0x06, 0xbf, local_settings['mic_led_brightness']], False),  # Mute mic led brightness (out of 10)
-            ([0x06, 0x43, 0x01], False),
-            ([0x06, 0x69, 0x00], False),
-            ([0x06, 0x3b, 0x00], False),
-            ([0x06, 0x8d, 0x01], False),
-            ([0x06, 0x49, 0x01], False),
-            ([0x06, 0xb7, 0x00], False),
-
-            # Another series of queries (perhaps for confirmation?)
-            ([0x06, 0xb7, 0x00], True),
-            ([0x06, 0xb7, 0x00], True),
-            (STATUS_REQUEST_MESSAGE, True),  # Get device status
-            ([0x06, 0x20, 0x00], True),
-            ([0x06, 0xb7, 0x00], True),
-        ]
-
         endpoint, _ = self.get_request_device_status()
         self.kernel_detach(endpoint)
 
-        for command in commands:
-            self.send_06_command(command[0], False)
+        for packet in INIT_PACKETS:
+            if isinstance(packet, SettingCommand):
+                packet = [*packet.prefix, local_settings[packet.setting]]
+
+            self.send_06_command(packet)
+
+    def manage_input_data(self, data: list[int] | bytes, endpoint: InterfaceEndpoint) -> DeviceState:
+        # pyusb returns an array('B'): convert it once, so that every access below works on a plain bytes buffer
+        if not isinstance(data, bytes):
+            data = bytes(data)
 
-    def manage_input_data(self, data: list[int], endpoint: InterfaceEndpoint) -> DeviceState:
         volume = 1
         device_status = None
 
-        if endpoint == InterfaceEndpoint(7, 0):
-            # Volume control is managed by the GameDAC
-            if len(data) >= 2 and data[0] == 0x07 and data[1] == 0x25:
-                # Volume is data[2]. If needed for any other purpose, it ranges between -56 (0%) and 0 (100%).
-                pass
-
-            elif len(data) >= 4 and data[0] == 0x07 and data[1] == 0x45:
-                self.log.debug('Received volume control data.')
-                self.game_mix = data[2] / 100  # Ranges from 0 to 100
-                self.chat_mix = data[3] / 100  # Ranges from 0 to 100
-            elif len(data) >= 16 and data[0] == 0x06 and data[1] == 0xb0:
-                # https://github.com/Sapd/HeadsetControl/blob/master/src/devices/steelseries_arctis_nova_pro_wireless.c#L242
-                device_status = DeviceStatus(
-                    bluetooth_powerup_state=DeviceStatusValue(data[2], 'on_off.off' if data[2] == 0x00 else 'on_off.on'),
-                    bluetooth_auto_mute=DeviceStatusValue(data[3], 'on_off.off' if data[3] == 0x00 else 'db.-12db' if data[3] == 0x01 else 'on_off.on'),
-                    bluetooth_power_status=DeviceStatusValue(data[4], 'on_off.off' if data[4] == 0x01 else 'on_off.on'),
-                    bluetooth_connection=DeviceStatusValue(data[5], 'on_off.off' if data[5] ==
-                                                           0x00 else 'connection.connected' if data[5] == 0x01 else 'connection.disconnected'),
-                    headset_battery_charge=DeviceStatusValue(data[6], mapped_val=lambda x: round(x / 8, 2)),
-                    charge_slot_battery_charge=DeviceStatusValue(data[7], mapped_val=lambda x: round(x / 8, 2)),
-                    transparent_noise_cancelling_level=DeviceStatusValue(data[8], mapped_val=lambda x: round(x / 10, 0)),
-                    mic_status=DeviceStatusValue(data[9], 'mic_status.unmuted' if data[9] == 0x00 else 'mic_status.muted'),
-                    noise_cancelling=DeviceStatusValue(data[10], 'on_off.off' if data[10] == 0x00 else 'anc.transparent' if data[10] == 0x01 else 'on_off.on'),
-                    mic_led_brightness=DeviceStatusValue(data[11], mapped_val=lambda x: x / 10),
-                    auto_off_time_minutes=DeviceStatusValue(data[12], mapped_val=lambda x: INACTIVE_TIME_MINUTES[x]),
-                    wireless_mode=DeviceStatusValue(data[13], 'wireless_mode.speed' if data[13] == 0x00 else 'wireless_mode.range'),
-                    wireless_pairing=DeviceStatusValue(data[14], 'pairing.not_paired' if data[14] ==
-                                                       0x01 else 'pairing.paired_offline' if data[13] == 0x04 else 'connection.connected'),
-                    headset_power_status=DeviceStatusValue(data[15], 'connection.offline' if data[15] ==
-                                                           0x01 else 'connection.cable_charging' if data[14] == 0x02 else 'connection.online'),
-                )
-            else:
-                self.log.debug(f'Incoming data from {endpoint.interface}, {endpoint.endpoint}: [{':'.join(hex(x)[2:] for x in data)}]')
+        handler = self.INPUT_HANDLERS.get(data[:2]) if endpoint == GAMEDAC_ENDPOINT else None
+        if handler is not None and len(data) >= handler[0]:
+            device_status = getattr(self, handler[1])(data)
         else:
-            self.log.debug(f'Incoming data from {endpoint.interface}, {endpoint.endpoint}: [{':'.join(hex(x)[2:] for x in data)}]')
+            self.log_incoming_data(data, endpoint)
 
         return DeviceState(
             game_volume=volume,
@@ -167,9 +233,57 @@ class ArctisNovaProWirelessDevice(DeviceManager):
             device_status=device_status,
         )
 
+    def on_volume_data(self, data: bytes) -> None:
+        # Volume control is managed by the GameDAC.
+        # Volume is data[2]. If needed for any other purpose, it ranges between -56 (0%) and 0 (100%).
+        pass
+
+    def on_mix_data(self, data: bytes) -> None:
+        self.log.debug('Received volume control data.')
+        self.game_mix = data[2] / 100  # Ranges from 0 to 100
+        self.chat_mix = data[3] / 100  # Ranges from 0 to 100
+
+    def on_status_data(self, data: bytes) -> DeviceStatus:
+        # https://github.com/Sapd/HeadsetControl/blob/master/src/devices/steelseries_arctis_nova_pro_wireless.c#L242
+        (
+            bt_powerup_state, bt_auto_mute, bt_power_status, bt_connection,
+            headset_battery, charge_slot_battery, anc_level, mic_status, noise_cancelling,
+            mic_led, auto_off_time, wireless_mode, wireless_pairing, headset_power_status,
+        ) = STATUS_STRUCT.unpack_from(data, 2)
+
+        return DeviceStatus(
+            bluetooth_powerup_state=DeviceStatusValue(bt_powerup_state, ON_OFF.get(bt_powerup_state, ON_OFF_ON)),
+            bluetooth_auto_mute=DeviceStatusValue(bt_auto_mute, BLUETOOTH_AUTO_MUTE.get(bt_auto_mute, ON_OFF_ON)),
+            bluetooth_power_status=DeviceStatusValue(bt_power_status, BLUETOOTH_POWER_STATUS.get(bt_power_status, ON_OFF_ON)),
+            bluetooth_connection=DeviceStatusValue(bt_connection, BLUETOOTH_CONNECTION.get(bt_connection, CONNECTION_DISCONNECTED)),
+            headset_battery_charge=DeviceStatusValue(headset_battery, mapped_val=battery_charge),
+            charge_slot_battery_charge=DeviceStatusValue(charge_slot_battery, mapped_val=battery_charge),
+            transparent_noise_cancelling_level=DeviceStatusValue(anc_level, mapped_val=noise_cancelling_level),
+            mic_status=DeviceStatusValue(mic_status, MIC_STATUS.get(mic_status, MIC_STATUS_MUTED)),
+            noise_cancelling=DeviceStatusValue(noise_cancelling, NOISE_CANCELLING.get(noise_cancelling, ON_OFF_ON)),
+            mic_led_brightness=DeviceStatusValue(mic_led, mapped_val=mic_led_brightness),
+            auto_off_time_minutes=DeviceStatusValue(auto_off_time, mapped_val=INACTIVE_TIME_MINUTES.__getitem__),
+            wireless_mode=DeviceStatusValue(wireless_mode, WIRELESS_MODE.get(wireless_mode, WIRELESS_MODE_RANGE)),
+            wireless_pairing=DeviceStatusValue(wireless_pairing, WIRELESS_PAIRING.get(wireless_pairing, CONNECTION_CONNECTED)),
+            headset_power_status=DeviceStatusValue(headset_power_status, HEADSET_POWER_STATUS.get(headset_power_status, CONNECTION_ONLINE)),
+        )
+
+    # GameDAC packet header -> (minimum packet length, handler method name).
+    # Handlers are looked up by name, so that subclasses can override them.
+    INPUT_HANDLERS: dict[bytes, tuple[int, str]] = {
+        bytes([0x07, 0x25]): (2, 'on_volume_data'),
+        bytes([0x07, 0x45]): (4, 'on_mix_data'),
+        bytes([0x06, 0xb0]): (16, 'on_status_data'),
+    }
+
+    def log_incoming_data(self, data: bytes, endpoint: InterfaceEndpoint) -> None:
+        # Skip formatting the packet altogether when debug logging is disabled
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug('Incoming data from %d, %d: [%s]', endpoint.interface, endpoint.endpoint, data.hex(':'))
+
     @staticmethod
-    def packet_0_filler(packet: list[int], size: int):
-        return [*packet, *[0 for _ in range(size - len(packet))]]
+    def packet_0_filler(packet: list[int] | bytes, size: int) -> bytes:
+        return bytes(packet).ljust(size, b'\x00')
 
     def get_configurable_settings(self, state: Optional[DeviceStatus] = None) -> dict[str, list[DeviceSetting]]:
         state = state or DeviceStatus()
@@ -244,10 +358,9 @@ class ArctisNovaProWirelessDevice(DeviceManager):
 
         self.send_06_command(STATUS_REQUEST_MESSAGE)
 
-    def send_06_command(self, command: list[int], kernel_detach: bool = False) -> None:
-        endpoint, _ = self.get_request_device_status()
-        commands_endpoint_address = self.device[0].interfaces()[endpoint.interface].endpoints()[endpoint.endpoint].bEndpointAddress
+    def send_06_command(self, command: list[int] | bytes, kernel_detach: bool = False) -> None:
         if kernel_detach:
+            endpoint, _ = self.get_request_device_status()
             self.kernel_detach(endpoint)
 
-        self.device.write(commands_endpoint_address, self.packet_0_filler(command, 64))
+        self.device.write(self.get_commands_endpoint_address(), self.packet_0_filler(command, COMMAND_PACKET_SIZE))
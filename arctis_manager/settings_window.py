@@ -1,3 +1,4 @@
+from functools import partial
 from typing import Callable, Optional
 
 from PyQt6.QtCore import Qt
@@ -8,7 +9,8 @@ from PyQt6.QtWidgets import (QFormLayout, QHBoxLayout, QLabel, QLayout,
 
 from arctis_manager.custom_widgets.q_toggle import QToggle
 from arctis_manager.device_manager.device_manager import DeviceManager
-from arctis_manager.device_manager.device_settings import (SliderSetting,
+from arctis_manager.device_manager.device_settings import (DeviceSetting,
+                                                           SliderSetting,
                                                            ToggleSetting)
 from arctis_manager.device_manager.device_status import DeviceStatus
 from arctis_manager.i18n_helpers import get_translated_menu_entries
@@ -19,6 +21,10 @@ from arctis_manager.translations import Translations
 class SettingsWindow(QWidget):
     manager: DeviceManager
 
+    _panel_stack: QStackedWidget
+    _status_labels: list[tuple[bool, QLabel]]
+    _panel_factories: list[Optional[Callable[[], QWidget]]]
+
     def __init__(self, manager: DeviceManager, status: DeviceStatus, parent: QWidget = None):
         super().__init__(parent=parent)
 
@@ -46,56 +52,22 @@ class SettingsWindow(QWidget):
 
         # Create a stacked widget for panels on the right
         panel_stack = QStackedWidget()
+        self._panel_stack = panel_stack
 
         # Status panel
         self._status_panel = QWidget()
+        self._status_labels = []
         layout = QFormLayout()
         layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-
-        for section, status_strings in get_translated_menu_entries(status).items():
-            section_label = QLabel(str(section))
-            label_font = section_label.font()
-            label_font.setBold(True)
-            section_label.setFont(label_font)
-            layout.addWidget(section_label)
-
-            for status_string in status_strings:
-                layout.addRow('', QLabel(str(status_string)))
-
         self._status_panel.setLayout(layout)
+        self.update_status(status)
         panel_stack.addWidget(self._status_panel)
 
-        # Settings panels
+        # Settings panels: placeholders, the actual panels are built on first access (see change_panel)
+        self._panel_factories = [None]
         for settings in sections.values():
-            panel = QWidget()
-            layout = QFormLayout()
-            layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-
-            for setting in settings:
-                widget_layout = QWidget()
-                w_layout = QHBoxLayout()
-                widget_layout.setLayout(w_layout)
-                w_layout.addWidget(QLabel(f'{setting.name}: '))
-
-                widget_layout: QLayout = None
-
-                if isinstance(setting, SliderSetting):
-                    widget_layout = self.get_slider_configuration_widget(
-                        setting.min_value, setting.max_value, setting.step,
-                        setting.current_state, setting.min_label, setting.max_label,
-                        setting.on_value_change
-                    )
-                elif isinstance(setting, ToggleSetting):
-                    widget_layout = self.get_checkbox_configuration_widget(
-                        setting.untoggled_label, setting.toggled_label, setting.current_state,
-                        setting.on_value_change
-                    )
-
-                if widget_layout is not None:
-                    layout.addRow(setting.name, widget_layout)
-            panel.setLayout(layout)
-
-            panel_stack.addWidget(panel)
+            self._panel_factories.append(partial(self.get_settings_panel, settings))
+            panel_stack.addWidget(QWidget())
 
         # Window layout
 
@@ -113,8 +85,7 @@ class SettingsWindow(QWidget):
         font.setPointSize(16)
         device_name_label.setFont(font)
 
-        # Main widget
-        main_widget = QWidget()
+        # Main layout
         main_layout = QVBoxLayout()
 
         # Add widgets to the layout
@@ -123,27 +94,74 @@ class SettingsWindow(QWidget):
         self.setLayout(main_layout)
 
     def update_status(self, status: DeviceStatus):
-        layout = self._status_panel.layout()
-        # Clear the layout from the previous status
-        while layout.count():
-            item = layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
-
+        # (is_section, text) for each row of the status panel
+        entries: list[tuple[bool, str]] = []
         for section, status_strings in get_translated_menu_entries(status).items():
-            section_label = QLabel(str(section))
-            label_font = section_label.font()
-            label_font.setBold(True)
-            section_label.setFont(label_font)
-            layout.addWidget(section_label)
-
-            for status_string in status_strings:
-                layout.addRow('', QLabel(str(status_string)))
+            entries.append((True, str(section)))
+            entries.extend((False, str(status_string)) for status_string in status_strings)
+
+        # Rebuild the rows only if the panel's structure changed (i.e. a status value appeared or disappeared),
+        # otherwise just update the existing labels' text.
+        if [is_section for is_section, _ in entries] != [is_section for is_section, _ in self._status_labels]:
+            layout: QFormLayout = self._status_panel.layout()
+            while layout.rowCount():
+                layout.removeRow(0)
+
+            self._status_labels = []
+            for is_section, _ in entries:
+                label = QLabel()
+                if is_section:
+                    label_font = label.font()
+                    label_font.setBold(True)
+                    label.setFont(label_font)
+                    layout.addRow(label)
+                else:
+                    layout.addRow('', label)
+
+                self._status_labels.append((is_section, label))
+
+        for (_, label), (_, text) in zip(self._status_labels, entries):
+            label.setText(text)
 
     def change_panel(self, index):
+        panel_stack = self._panel_stack
+
+        # Replace the placeholder with the actual settings panel, the first time it's shown
+        if 0 <= index < len(self._panel_factories) and self._panel_factories[index] is not None:
+            placeholder = panel_stack.widget(index)
+            panel_stack.insertWidget(index, self._panel_factories[index]())
+            panel_stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self._panel_factories[index] = None
+
         # Change the panel based on the selected section
-        self.findChild(QStackedWidget).setCurrentIndex(index)
+        panel_stack.setCurrentIndex(index)
+
+    def get_settings_panel(self, settings: list[DeviceSetting]) -> QWidget:
+        panel = QWidget()
+        layout = QFormLayout()
+        layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+
+        for setting in settings:
+            widget_layout: QLayout = None
+
+            if isinstance(setting, SliderSetting):
+                widget_layout = self.get_slider_configuration_widget(
+                    setting.min_value, setting.max_value, setting.step,
+                    setting.current_state, setting.min_label, setting.max_label,
+                    setting.on_value_change
+                )
+            elif isinstance(setting, ToggleSetting):
+                widget_layout = self.get_checkbox_configuration_widget(
+                    setting.untoggled_label, setting.toggled_label, setting.current_state,
+                    setting.on_value_change
+                )
+
+            if widget_layout is not None:
+                layout.addRow(setting.name, widget_layout)
+        panel.setLayout(layout)
+
+        return panel
 
     def get_slider_configuration_widget(
         self, min: int, max: int, step: int, default_value: int, min_label: str, max_label: str, on_value_changed: Optional[Callable[[int], None]]
@@ -180,7 +198,8 @@ class SettingsWindow(QWidget):
         layout.addWidget(QLabel(on_label))
 
         if on_value_changed is not None:
-            controller.stateChanged.connect(lambda: on_value_changed(controller.isChecked()))
+            # The lambda keeps a strong reference to the callback: PyQt only holds bound methods weakly
+            controller.toggled.connect(lambda checked: on_value_changed(checked))
 
         return layout
 